@@ -1,6 +1,4 @@
-from dwdparse.api import parse, parse_url
-from dwdparse.parsers import get_parser
-from dwdparse.stations import load_stations
+import importlib
 
 
 __version__ = '0.9.7'
@@ -9,5 +7,27 @@ __all__ = [
    'get_parser',
    'load_stations',
    'parse',
+   'parse_batches',
    'parse_url',
 ]
+
+
+# Submodules are imported on first access (PEP 562) so that importing the
+# package (e.g. for `dwdparse --help` or reading `__version__`) stays cheap
+_LAZY_ATTRIBUTES = {
+    'get_parser': 'dwdparse.parsers',
+    'load_stations': 'dwdparse.stations',
+    'parse': 'dwdparse.api',
+    'parse_batches': 'dwdparse.api',
+    'parse_url': 'dwdparse.api',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
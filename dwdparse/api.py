@@ -1,35 +1,88 @@
+import functools
+import itertools
 import logging
+import os
 import pathlib
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 from dwdparse.parsers import get_parser
-from dwdparse.utils import fetch
+from dwdparse.utils import fetch_to_file
 
 
 logger = logging.getLogger(__name__)
 
 
-def parse(path, **extra):
-    return get_parser(pathlib.Path(path).name)().parse(path, **extra)
+def parse(path, filename=None, **extra):
+    """
+    Parse the file at `path`, which may also be a binary file object (e.g.
+    for data that is already in memory). The parser is chosen by `filename`,
+    which defaults to the name of `path`.
+    """
+    if filename is None:
+        name = getattr(path, 'name', path)
+        if not isinstance(name, (str, os.PathLike)):
+            raise ValueError(
+                "Must supply a `filename` keyword argument for file objects "
+                "without a name",
+            )
+        filename = os.path.basename(name)
+    return get_parser(filename)().parse(path, **extra)
 
 
-def parse_url(url):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        file_path = _download(url, tmpdir)
-        parser = get_parser(file_path.name)()
-        extra = {
-            kwarg: _download(extra_url, tmpdir)
-            for kwarg, extra_url in parser.get_extra_urls(file_path).items()
-        }
-        yield from parser.parse(file_path, **extra)
+def parse_batches(path, batch_size=4096, **extra):
+    """
+    Like `parse()`, but yield lists of up to `batch_size` records, e.g. for
+    bulk database inserts.
+    """
+    records = parse(path, **extra)
+    while batch := list(itertools.islice(records, batch_size)):
+        yield batch
+
+
+def parse_url(url, tmpdir=None):
+    """
+    Download and parse the file at `url`. Downloads are stored in `tmpdir`
+    if given (and left there for the caller to clean up), or otherwise in a
+    temporary directory that is removed after parsing.
+    """
+    if tmpdir is None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield from parse_url(url, tmpdir=tmpdir)
+        return
+    file_path, extra = download(url, tmpdir)
+    yield from parse(file_path, **extra)
+
+
+def download(url, tmpdir):
+    """
+    Download file at `url` and any extra files its parser requires into
+    `tmpdir`. Returns the local file path and the keyword arguments that
+    should be passed on to `parse()`.
+    """
+    file_path = _download(url, tmpdir)
+    parser = get_parser(file_path.name)()
+    extra_urls = parser.get_extra_urls(file_path)
+    # Extra files are independent of each other, fetch them concurrently
+    unique_urls = list(dict.fromkeys(extra_urls.values()))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = pool.map(
+            functools.partial(_download, tmpdir=tmpdir),
+            unique_urls,
+        )
+        downloaded = dict(zip(unique_urls, paths))
+    extra = {kwarg: downloaded[url] for kwarg, url in extra_urls.items()}
+    return file_path, extra
 
 
 def _download(url, tmpdir):
-    dir_path = pathlib.Path(tmpdir)
-    filename = pathlib.Path(urlparse(url).path).name
-    file_path = dir_path / filename
+    url_path = urlparse(url).path
+    if url.startswith('file:'):
+        # Already local, no need to copy it anywhere
+        return pathlib.Path(url2pathname(url_path))
+    file_path = pathlib.Path(tmpdir, os.path.basename(url_path))
     logger.info("Downloading %s to %s", url, file_path)
-    with file_path.open('wb') as f:
-        f.write(fetch(url))
+    fetch_to_file(url, file_path)
     return file_path
@@ -1,17 +1,25 @@
 import argparse
+import collections
 import logging
 import os
-import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, suppress
 
-from dwdparse.api import parse, parse_url
-from dwdparse.stations import StationIDConverter, load_stations
-from dwdparse.units import convert_record
-from dwdparse.utils import configure_logging, dump_records, fetch
+from dwdparse.utils import configure_logging, dump_records, fetch_to_file
 
 
 logger = logging.getLogger(__name__)
 
 
+URL_PREFIXES = ('http://', 'https://', 'file://')
+
+# Downloaded station lists are reused for one day
+STATION_LIST_MAX_AGE = 24 * 60 * 60
+
+
 EPILOG = """
 examples:
   # Parse local file
@@ -46,7 +54,11 @@ parser.add_argument(
 parser.add_argument(
     '--load-stations',
     action='store_true',
-    help='download DWD/WMO station ID mappings before parsing',
+    help=(
+        'download DWD/WMO station ID mappings before parsing; unless '
+        '--stations is given, the list is cached for a day in '
+        '$XDG_CACHE_HOME/dwdparse (default ~/.cache/dwdparse)'
+    ),
 )
 parser.add_argument(
     '--stations',
@@ -56,6 +68,15 @@ parser.add_argument(
         'the list to the supplied path if (and only if) it does not exist'
     ),
 )
+parser.add_argument(
+    '--jobs',
+    type=int,
+    default=8,
+    help=(
+        'number of remote targets to download ahead of the one being parsed '
+        '(default: %(default)s)'
+    ),
+)
 parser.add_argument(
     'targets',
     help='path or URL of file(s) to be parsed',
@@ -65,19 +86,98 @@ parser.add_argument(
 
 
 def main():
-    configure_logging()
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    configure_logging()
+    # Import lazily so that `--help` and argument errors don't have to load
+    # the parsers
+    from dwdparse.stations import StationIDConverter, load_stations
+    from dwdparse.units import convert_records
     if args.stations:
         if args.load_stations and not os.path.exists(args.stations):
             logger.info("Downloading station list to %s", args.stations)
-            with open(args.stations, 'wb') as f:
-                f.write(fetch(StationIDConverter.STATION_LIST_URL))
+            fetch_to_file(
+                StationIDConverter.STATION_LIST_URL,
+                args.stations,
+                accept_gzip=True,
+            )
         load_stations(path=args.stations)
     elif args.load_stations:
-        load_stations()
-    for target in args.targets:
-        command = parse_url if re.match(r'^https?://', target) else parse
-        records = command(target)
-        if args.units:
-            records = (convert_record(r, args.units) for r in records)
-        dump_records(records)
+        load_stations(path=_get_cached_station_list())
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Close the generator (and with it the download pool) before the
+        # temporary directory is removed, even if dumping fails
+        records = _parse_targets(args.targets, tmpdir, args.jobs)
+        with closing(records):
+            if args.units:
+                records = convert_records(records, args.units)
+            dump_records(records)
+
+
+def _parse_targets(targets, tmpdir, jobs):
+    # Download remote targets in the background while the preceding ones are
+    # being parsed, but stay at most `jobs` targets ahead so that long target
+    # lists don't pile up on disk
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = collections.deque()
+        for target in targets:
+            pending.append(_start_target(pool, target, tmpdir))
+            if len(pending) > jobs:
+                yield from _finish_target(*pending.popleft())
+        while pending:
+            yield from _finish_target(*pending.popleft())
+
+
+def _start_target(pool, target, tmpdir):
+    if not target.startswith(URL_PREFIXES):
+        return None, target
+    from dwdparse.api import download
+    # Separate directory per target so that equally named files from different
+    # URLs don't overwrite each other
+    target_dir = tempfile.mkdtemp(dir=tmpdir)
+    return target_dir, pool.submit(download, target, target_dir)
+
+
+def _finish_target(target_dir, target):
+    from dwdparse.api import parse
+    if target_dir is None:
+        yield from parse(target)
+        return
+    path, extra = target.result()
+    try:
+        yield from parse(path, **extra)
+    finally:
+        shutil.rmtree(target_dir)
+
+
+def _get_cached_station_list():
+    from dwdparse.stations import StationIDConverter
+    cache_dir = os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+        'dwdparse',
+    )
+    path = os.path.join(cache_dir, 'stations.html')
+    with suppress(FileNotFoundError):
+        if time.time() - os.path.getmtime(path) < STATION_LIST_MAX_AGE:
+            return path
+    os.makedirs(cache_dir, exist_ok=True)
+    logger.info("Downloading station list to %s", path)
+    # Download to a temporary path first so that concurrent runs never load a
+    # partially written list
+    tmp_path = f'{path}.{os.getpid()}'
+    fetch_to_file(
+        StationIDConverter.STATION_LIST_URL,
+        tmp_path,
+        accept_gzip=True,
+    )
+    try:
+        # Make sure we got an actual station list before caching it for a
+        # whole day, e.g. not an error page
+        StationIDConverter().load(tmp_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return path
+
@@ -1,7 +1,9 @@
 import array
+import bisect
 import bz2
 import csv
 import datetime
+import functools
 import io
 import itertools
 import json
@@ -11,7 +13,7 @@ import sys
 import tarfile
 import xml.etree.ElementTree as ET
 import zipfile
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 
 from dwdparse.stations import (
     dwd_id_to_wmo,
@@ -34,10 +36,31 @@ from dwdparse.units import (
 )
 
 
+UTC = datetime.timezone.utc
+
+
 class SkipRecord(Exception):
     pass
 
 
+def _is_file(path):
+    return hasattr(path, 'read')
+
+
+@contextmanager
+def _open_text(path):
+    # Accept binary file objects, but leave closing them to the caller
+    if not _is_file(path):
+        with open(path) as f:
+            yield f
+        return
+    f = io.TextIOWrapper(path)
+    try:
+        yield f
+    finally:
+        f.detach()
+
+
 class Parser:
 
     @property
@@ -72,6 +95,12 @@ class MOSMIXParser(Parser):
         'VV': 'visibility',
         'ww': 'condition',
     }
+    STREAM_TAGS = [
+        'dwd:ProductID',
+        'dwd:IssueTime',
+        'dwd:ForecastTimeSteps',
+        'kml:Placemark',
+    ]
 
     def parse(self, path):
         self.logger.info("Parsing %s", path)
@@ -85,20 +114,29 @@ class MOSMIXParser(Parser):
         timestamps = None
         source = None
         ns = {}
-        for event, element in ET.iterparse(f, ['end', 'start-ns']):
+        tags = {}
+        for event, element in self._iterparse(f):
             if event == 'start-ns':
                 ns[element[0]] = element[1]
+                # Qualify our tag names again once the next element is done
+                tags = {}
                 continue
-            elif self._is_tag(element, 'dwd:ProductID', ns):
+            if not tags:
+                tags = {
+                    self._qualify(tag, ns): tag
+                    for tag in self.STREAM_TAGS
+                }
+            tag = tags.get(element.tag)
+            if tag == 'dwd:ProductID':
                 assert source is None, "Unexpected extra product ID"
                 source = element.text
-            elif self._is_tag(element, 'dwd:IssueTime', ns):
+            elif tag == 'dwd:IssueTime':
                 assert source is not None, "Unexpected issue time w/o ID"
                 source += ':' + element.text
-            elif self._is_tag(element, 'dwd:ForecastTimeSteps', ns):
+            elif tag == 'dwd:ForecastTimeSteps':
                 assert timestamps is None, "Unexpected extra time steps"
                 timestamps = self.parse_timestamps(element, ns)
-            elif self._is_tag(element, 'kml:Placemark', ns):
+            elif tag == 'kml:Placemark':
                 assert timestamps is not None, "Placemark without time steps"
                 assert source is not None, "Placemark without source"
                 records = self.parse_station(element, ns, timestamps, source)
@@ -106,43 +144,66 @@ class MOSMIXParser(Parser):
                 # XXX: Reduce memory footprint from 1 GB to 30 MB
                 element.clear()
 
-    def _is_tag(self, element, tag, ns):
+    def _iterparse(self, f):
+        events = ['end', 'start-ns']
+        with suppress(ImportError):
+            import lxml.etree
+            # Let libxml2 skip end events of elements we don't look at
+            return lxml.etree.iterparse(
+                f,
+                events,
+                tag=['{*}' + tag.split(':')[1] for tag in self.STREAM_TAGS],
+                resolve_entities=False,
+                remove_blank_text=True,
+            )
+        return ET.iterparse(f, events)
+
+    def _qualify(self, tag, ns):
         prefix, tag = tag.split(':')
-        return element.tag == f'{{{ns[prefix]}}}{tag}'
+        return f'{{{ns[prefix]}}}{tag}'
 
     def parse_timestamps(self, steps, ns):
-        return [
-            datetime.datetime.fromisoformat(re.sub(r'Z$', '+00:00', el.text))
-            for el in steps.findall('dwd:TimeStep', ns)
-        ]
+        timestamps = []
+        for el in steps.findall('dwd:TimeStep', ns):
+            text = el.text
+            # fromisoformat() only accepts the 'Z' suffix from Python 3.11 on
+            if text.endswith('Z'):
+                text = text[:-1] + '+00:00'
+            timestamps.append(datetime.datetime.fromisoformat(text))
+        return timestamps
 
     def parse_station(self, place, ns, timestamps, source):
-        wmo_station_id = place.find('kml:name', ns).text
+        # Fully qualified tags skip ElementPath's prefix handling, which
+        # would otherwise run for each of the station's forecasts
+        tag = functools.partial(self._qualify, ns=ns)
+        wmo_station_id = place.find(tag('kml:name')).text
         dwd_station_id = wmo_id_to_dwd(wmo_station_id)
-        station_name = place.find('kml:description', ns).text
+        station_name = place.find(tag('kml:description')).text
         try:
-            coords = place.find('kml:Point', ns).find('kml:coordinates', ns)
+            coords = place.find(tag('kml:Point')).find(tag('kml:coordinates'))
             lon, lat, height = coords.text.split(',')
         except AttributeError:
             self.logger.warning(
                 "Ignoring station without coordinates, WMO ID '%s', DWD ID "
                 "'%s', name '%s'",
                 wmo_station_id, dwd_station_id, station_name)
-            return []
+            return
         records = {'timestamp': timestamps}
-        data = place.find('kml:ExtendedData', ns)
-        for forecast in data.findall('dwd:Forecast', ns):
-            param = forecast.attrib[f"{{{ns['dwd']}}}elementName"]
+        data = place.find(tag('kml:ExtendedData'))
+        param_key = tag('dwd:elementName')
+        value_tag = tag('dwd:value')
+        for forecast in data.iterfind(tag('dwd:Forecast')):
+            param = forecast.attrib[param_key]
             try:
                 column = self.ELEMENTS[param]
             except KeyError:
                 continue
-            values_str = forecast.find('dwd:value', ns).text
+            values_str = forecast.find(value_tag).text
             converter = getattr(self, f'parse_{column}', float)
             # XXX: Roughly 50 % of our parsing time is spent here
             records[column] = [
                 None if x == '-' else converter(x)
-                for x in re.split(r'\s+', values_str.strip())
+                for x in values_str.split()
             ]
             assert len(records[column]) == len(timestamps)
         base_record = {
@@ -156,10 +217,11 @@ class MOSMIXParser(Parser):
             'station_name': station_name,
         }
         # Turn dict of lists into list of dicts
-        return (
-            {**base_record, **dict(zip(records, row))}
-            for row in zip(*records.values())
-        )
+        columns = list(records)
+        for row in zip(*records.values()):
+            record = base_record.copy()
+            record.update(zip(columns, row))
+            yield record
 
     def _convert(self, value, converter):
         try:
@@ -168,7 +230,7 @@ class MOSMIXParser(Parser):
             return None
 
     def parse_condition(self, value):
-        code = int(value.split('.')[0])
+        code = int(value.partition('.')[0])
         return synop_current_weather_code_to_condition(code)
 
     def parse_solar(self, value):
@@ -237,6 +299,9 @@ class SYNOPParser(Parser):
         with suppress(ImportError):
             import ijson
             return ijson.items(f, 'messages.item', use_float=True)
+        with suppress(ImportError):
+            import orjson
+            return orjson.loads(f.read())['messages']
         return json.load(f)['messages']
 
     def parse_message(self, message):
@@ -280,7 +345,7 @@ class SYNOPParser(Parser):
             raise SkipRecord
         record['timestamp'] = datetime.datetime(
             data['year'], data['month'], data['day'], data['hour'],
-            data['minute'], tzinfo=datetime.timezone.utc)
+            data['minute'], tzinfo=UTC)
 
     def parse_stationNumber(self, record, data, value):
         if data['stationNumber']:
@@ -347,7 +412,7 @@ class CurrentObservationsParser(Parser):
 
     def parse(self, path, lat=None, lon=None, height=None, station_name=None):
         self.logger.info("Parsing %s", path)
-        with open(path) as f:
+        with _open_text(path) as f:
             reader = csv.DictReader(f, delimiter=';')
             wmo_station_id = next(reader)[self.DATE_COLUMN].rstrip('_')
             dwd_station_id = wmo_id_to_dwd(wmo_station_id)
@@ -365,27 +430,34 @@ class CurrentObservationsParser(Parser):
                     **self.parse_row(row)
                 }
 
-    def parse_row(self, row):
-        record = {
-            element: (
-                None
-                if row[column] == '---'
-                else float(row[column].replace(',', '.')))
+    @functools.cached_property
+    def element_columns(self):
+        return [
+            (column, element, self.CONVERTERS.get(element))
             for column, element in self.ELEMENTS.items()
-        }
-        record['timestamp'] = datetime.datetime.strptime(
-            f'{row[self.DATE_COLUMN]} {row[self.HOUR_COLUMN]}',
-            '%d.%m.%y %H:%M'
-        ).replace(tzinfo=datetime.timezone.utc)
-        self.convert_units(record)
+        ]
+
+    def parse_row(self, row):
+        record = {}
+        for column, element, converter in self.element_columns:
+            value = row[column]
+            if value == '---':
+                record[element] = None
+            elif converter:
+                record[element] = converter(float(value.replace(',', '.')))
+            else:
+                record[element] = float(value.replace(',', '.'))
+        # Slicing is much faster than strptime() with '%d.%m.%y %H:%M'
+        date = row[self.DATE_COLUMN]
+        hour = row[self.HOUR_COLUMN]
+        record['timestamp'] = datetime.datetime(
+            2000 + int(date[6:8]), int(date[3:5]), int(date[:2]),
+            int(hour[:2]), int(hour[3:5]),
+            tzinfo=UTC,
+        )
         self.sanitize_record(record)
         return record
 
-    def convert_units(self, record):
-        for element, converter in self.CONVERTERS.items():
-            if record[element] is not None:
-                record[element] = converter(record[element])
-
     def sanitize_record(self, record):
         if record['cloud_cover'] and record['cloud_cover'] > 100:
             self.logger.warning(
@@ -403,6 +475,8 @@ class CurrentObservationsParser(Parser):
 
 class ObservationsParser(Parser):
 
+    STATION_ID_PATTERN = re.compile(r'Metadaten_Geographie_(\d+)\.txt')
+
     elements = {}
     converters = {}
     ignored_values = {}
@@ -427,7 +501,7 @@ class ObservationsParser(Parser):
 
     def parse_station_id(self, zf, **extra):
         for filename in zf.namelist():
-            if (m := re.match(r'Metadaten_Geographie_(\d+)\.txt', filename)):
+            if (m := self.STATION_ID_PATTERN.match(filename)):
                 return m.group(1)
         raise ValueError(f"Unable to parse station ID for {zf.filename}")
 
@@ -438,15 +512,20 @@ class ObservationsParser(Parser):
                 delimiter=';')
             history = {}
             for row in reader:
-                date_from = datetime.datetime.strptime(
-                    row['von_datum'].strip(), '%Y%m%d'
-                ).replace(tzinfo=datetime.timezone.utc)
+                date = row['von_datum'].strip()
+                date_from = datetime.datetime(
+                    int(date[:4]), int(date[4:6]), int(date[6:8]),
+                    tzinfo=UTC,
+                )
                 history[date_from] = (
                     float(row['Geogr.Breite']),
                     float(row['Geogr.Laenge']),
                     float(row['Stationshoehe']),
                     row['Stationsname'])
-            return history
+            # Sorted start dates and their station parameters, so that
+            # _station_params() can bisect
+            dates = sorted(history)
+            return dates, [history[date] for date in dates]
 
     def parse_records(self, zf, lat_lon_history, **extra):
         product_filenames = [
@@ -454,18 +533,34 @@ class ObservationsParser(Parser):
         assert len(product_filenames) == 1, "Unexpected product count"
         filename = product_filenames[0]
         with zf.open(filename) as f:
-            reader = csv.DictReader(
+            reader = csv.reader(
                 io.TextIOWrapper(f, encoding='latin1'),
                 delimiter=';')
-            yield from self.parse_reader(filename, reader, lat_lon_history)
+            # Plain lists are much cheaper than one dict per row, look up
+            # values through their header index instead
+            columns = {column: i for i, column in enumerate(next(reader))}
+            # Resolve everything parse_elements() needs per element once
+            element_columns = [
+                (
+                    element,
+                    columns[element_key],
+                    self.ignored_values.get(element, ()),
+                    self.converters.get(element),
+                )
+                for element, element_key in self.elements.items()
+            ]
+            yield from self.parse_reader(
+                filename, reader, lat_lon_history, columns, element_columns)
 
-    def parse_reader(self, filename, reader, lat_lon_history):
+    def parse_reader(
+            self, filename, reader, lat_lon_history, columns,
+            element_columns):
+        date_idx = columns['MESS_DATUM']
         for row in reader:
-            timestamp = datetime.datetime.strptime(
-                row['MESS_DATUM'],
-                '%Y%m%d%H',
-            ).replace(
-                tzinfo=datetime.timezone.utc,
+            date = row[date_idx]
+            timestamp = datetime.datetime(
+                int(date[:4]), int(date[4:6]), int(date[6:8]), int(date[8:10]),
+                tzinfo=UTC,
             )
             if self.skip_timestamp(timestamp):
                 continue
@@ -478,30 +573,25 @@ class ObservationsParser(Parser):
                 'height': height,
                 'station_name': station_name,
                 'timestamp': timestamp,
-                **self.parse_elements(row, lat, lon, height),
+                **self.parse_elements(row, lat, lon, height, element_columns),
             }
 
     def _station_params(self, timestamp, lat_lon_history):
-        info = None
-        for date, lat_lon_height_name in lat_lon_history.items():
-            if date > timestamp:
-                break
-            info = lat_lon_height_name
-        return info
-
-    def parse_elements(self, row, lat, lon, height):
-        elements = {
-            element: (
-                float(row[element_key])
-                if row[element_key].strip() != '-999'
-                and row[element_key].strip() not in self.ignored_values.get(
-                    element, [])
-                else None)
-            for element, element_key in self.elements.items()
-        }
-        for element, converter in self.converters.items():
-            if elements[element] is not None:
-                elements[element] = converter(elements[element])
+        dates, station_params = lat_lon_history
+        idx = bisect.bisect_right(dates, timestamp)
+        if idx:
+            return station_params[idx - 1]
+
+    def parse_elements(self, row, lat, lon, height, element_columns):
+        elements = {}
+        for element, idx, ignored, converter in element_columns:
+            value = row[idx].strip()
+            if value == '-999' or value in ignored:
+                elements[element] = None
+            elif converter:
+                elements[element] = converter(float(value))
+            else:
+                elements[element] = float(value)
         return elements
 
     def skip_timestamp(self, timestamp):
@@ -511,6 +601,7 @@ class ObservationsParser(Parser):
 class TenMinutesObservationsParser(ObservationsParser):
 
     META_DATA_URL = None
+    STATION_ID_PATTERN = re.compile(r'produkt_.*_(\d+)\.txt')
     TRIGGER_MINUTE = 0
 
     def get_extra_urls(self, path):
@@ -522,12 +613,6 @@ class TenMinutesObservationsParser(ObservationsParser):
             ),
         }
 
-    def parse_station_id(self, zf, **extra):
-        for filename in zf.namelist():
-            if (m := re.match(r'produkt_.*_(\d+)\.txt', filename)):
-                return m.group(1)
-        raise ValueError(f"Unable to parse station ID for {zf.filename}")
-
     def parse_lat_lon_history(self, zf, dwd_station_id, **extra):
         if 'meta_path' not in extra:
             raise ValueError(
@@ -537,20 +622,24 @@ class TenMinutesObservationsParser(ObservationsParser):
         with zipfile.ZipFile(extra['meta_path']) as meta_zf:
             return super().parse_lat_lon_history(meta_zf, dwd_station_id)
 
-    def parse_reader(self, filename, reader, lat_lon_history):
+    def parse_reader(
+            self, filename, reader, lat_lon_history, columns,
+            element_columns):
+        date_idx = columns['MESS_DATUM']
         hour_values = []
         for row in reader:
-            timestamp = datetime.datetime.strptime(
-                row['MESS_DATUM'],
-                '%Y%m%d%H%M',
-            ).replace(
-                tzinfo=datetime.timezone.utc,
+            date = row[date_idx]
+            timestamp = datetime.datetime(
+                int(date[:4]), int(date[4:6]), int(date[6:8]),
+                int(date[8:10]), int(date[10:12]),
+                tzinfo=UTC,
             )
             if self.skip_timestamp(timestamp + datetime.timedelta(minutes=50)):
                 continue
             # XXX: Station parameters are currently not supported for
             #      10-minute parsers
-            hour_values.append(self.parse_elements(row, None, None, None))
+            hour_values.append(
+                self.parse_elements(row, None, None, None, element_columns))
             if timestamp.minute == self.TRIGGER_MINUTE:
                 if self.TRIGGER_MINUTE > 30:
                     # Likely triggered at :50, round to next full hour
@@ -611,13 +700,18 @@ class PrecipitationObservationsParser(ObservationsParser):
         'condition': synop_form_of_precipitation_code_to_condition,
     }
 
-    def parse_reader(self, filename, reader, lat_lon_history):
+    def parse_reader(
+            self, filename, reader, lat_lon_history, columns,
+            element_columns):
         # XXX: WRTR is missing every third hour, we fill it up from the
         #      previous or next row where sensible
+        fill_wrtr = functools.partial(self.fill_wrtr, columns)
         return super().parse_reader(
             filename,
-            itertools.starmap(self.fill_wrtr, self.with_neighbors(reader)),
+            itertools.starmap(fill_wrtr, self.with_neighbors(reader)),
             lat_lon_history,
+            columns,
+            element_columns,
         )
 
     def with_neighbors(self, it):
@@ -632,17 +726,19 @@ class PrecipitationObservationsParser(ObservationsParser):
             itertools.chain(c, [None]),
         )
 
-    def fill_wrtr(self, last_row, row, next_row):
-        if row['WRTR'] != '-999':
+    def fill_wrtr(self, columns, last_row, row, next_row):
+        wrtr = columns['WRTR']
+        rs_ind = columns['RS_IND']
+        if row[wrtr] != '-999':
             pass
-        elif row['RS_IND'].strip() == '0':
-            row['WRTR'] = '0'
-        elif last_row and last_row['RS_IND'].strip() == '1':
-            row['WRTR'] = last_row['WRTR']
-        elif next_row and next_row['RS_IND'].strip() == '1':
-            row['WRTR'] = next_row['WRTR']
+        elif row[rs_ind].strip() == '0':
+            row[wrtr] = '0'
+        elif last_row and last_row[rs_ind].strip() == '1':
+            row[wrtr] = last_row[wrtr]
+        elif next_row and next_row[rs_ind].strip() == '1':
+            row[wrtr] = next_row[wrtr]
         else:
-            row['WRTR'] = '9'
+            row[wrtr] = '9'
         return row
 
 
@@ -726,8 +822,9 @@ class PressureObservationsParser(ObservationsParser):
         'pressure_station': hpa_to_pa,
     }
 
-    def parse_elements(self, row, lat, lon, height):
-        elements = super().parse_elements(row, lat, lon, height)
+    def parse_elements(self, row, lat, lon, height, element_columns):
+        elements = super().parse_elements(
+            row, lat, lon, height, element_columns)
         if not elements['pressure_msl'] and elements['pressure_station']:
             # Some stations do not record reduced pressure, but do record
             # pressure at station height. We can approximate the pressure at
@@ -786,15 +883,22 @@ class RADOLANParser(Parser):
     WIDTH = 1100
     INTERVAL = 5
     PRECISION = 'E-02'
+    OFFSET_PATTERN = re.compile(r'VV([ \d]{4})')
 
     def parse(self, path):
-        with tarfile.open(path, 'r:bz2') as tar:
-            for filename in sorted(tar.getnames()):
-                yield self.parse_single(tar.extractfile(filename))
+        source = {'fileobj': path} if _is_file(path) else {'name': path}
+        with tarfile.open(mode='r:bz2', **source) as tar:
+            members = sorted(tar.getmembers(), key=lambda m: m.name)
+            for member in members:
+                yield self.parse_single(tar.extractfile(member))
 
     def parse_single(self, f):
-        product, timestamp, offset = self.parse_header(f)
-        data = self.parse_data(f)
+        buf = f.read()
+        # Header is terminated by ETX (0x03)
+        header_end = buf.index(b'\x03')
+        product, timestamp, offset = self.parse_header(
+            buf[:header_end].decode('ascii'))
+        data = self.parse_data(memoryview(buf)[header_end+1:])
         return {
             'observation_type': 'radar',
             'source': f'RADOLAN::{product}::{timestamp.isoformat()}',
@@ -802,10 +906,7 @@ class RADOLANParser(Parser):
             **data,
         }
 
-    def parse_header(self, f):
-        header = ''
-        while (ch := f.read(1)) != b'\x03':
-            header += ch.decode()
+    def parse_header(self, header):
         # Product type
         product = header[:2]
         assert product == self.PRODUCT
@@ -815,7 +916,7 @@ class RADOLANParser(Parser):
             header[2:8] + header[13:17],
             '%d%H%M%m%y',
         ).replace(
-            tzinfo=datetime.timezone.utc,
+            tzinfo=UTC,
         )
         # 1200 km x 1100 km grid
         assert f'GP{self.HEIGHT}x{self.WIDTH}' in header
@@ -826,12 +927,11 @@ class RADOLANParser(Parser):
         assert f'PR{self.PRECISION:>5s}' in header
         # Five minute interval
         assert f'INT{self.INTERVAL:4d}' in header
-        offset_minutes = int(re.search(r'VV([ \d]{4})', header).group(1))
+        offset_minutes = int(self.OFFSET_PATTERN.search(header).group(1))
         offset = datetime.timedelta(minutes=offset_minutes)
         return product, timestamp, offset
 
-    def parse_data(self, f):
-        buf = f.read()
+    def parse_data(self, buf):
         assert len(buf) == 2 * self.HEIGHT * self.WIDTH, "Unexpected grid size"
         raw = array.array('H')
         raw.frombytes(buf)
@@ -843,11 +943,14 @@ class RADOLANParser(Parser):
 
     def process_raw_data(self, raw):
         multiplier = float('1' + self.PRECISION)
+        # Convert every possible raw value once. Looking cells up is faster
+        # than converting each one, and all cells then share the same float
+        # objects instead of allocating 1.3 million new ones per grid.
+        values = [x * multiplier for x in range(4096)]
+        values += [None] * (2**16 - len(values))
+        lookup = values.__getitem__
         return [
-            [
-                x * multiplier if x < 4096 else None
-                for x in raw[row*self.WIDTH:(row+1)*self.WIDTH]
-            ]
+            list(map(lookup, raw[row*self.WIDTH:(row+1)*self.WIDTH]))
             for row in reversed(range(self.HEIGHT))
         ]
 
@@ -857,6 +960,11 @@ class CAPParser(Parser):
     ns = {
         'cap': 'urn:oasis:names:tc:emergency:cap:1.2',
     }
+    # Qualified in advance, these are compared against every element
+    ALERT_TAG = '{%s}alert' % ns['cap']
+    IDENTIFIER_TAG = '{%s}identifier' % ns['cap']
+    INFO_TAG = '{%s}info' % ns['cap']
+    LANGUAGE_TAG = '{%s}language' % ns['cap']
 
     TAG_MAP = {
         'de': {
@@ -895,6 +1003,10 @@ class CAPParser(Parser):
         'onset',
         'expires',
     ]
+    # Let ElementPath filter by valueName instead of checking each child
+    EVENT_CODE_PATH = "cap:eventCode[cap:valueName='II']/cap:value"
+    WARN_CELL_ID_PATH = (
+        "cap:area/cap:geocode[cap:valueName='WARNCELLID']/cap:value")
 
     def parse(self, path):
         self.logger.info("Parsing %s", path)
@@ -905,26 +1017,54 @@ class CAPParser(Parser):
 
     def parse_event(self, f):
         event = {}
-        for _, element in ET.iterparse(f):
-            if self._is_tag(element, 'cap:info'):
+        for _, element in self._iterparse(f):
+            if element.tag == self.INFO_TAG:
                 self._parse_info(event, element)
                 element.clear()
-            elif self._is_tag(element, 'cap:alert'):
+            elif element.tag == self.ALERT_TAG:
                 event['id'] = element.find(
-                    'cap:identifier',
-                    self.ns,
+                    self.IDENTIFIER_TAG,
                 ).text.rsplit('.', 1)[0]
         self.sanitize_event(event)
         return event
 
+    @functools.cached_property
+    def tag_fields(self):
+        # TAG_MAP with qualified tags and resolved OPTIONAL_FIELDS, so that
+        # _parse_info() doesn't have to redo this for every <info>
+        return {
+            lang: [
+                (
+                    tag,
+                    '{%s}%s' % (self.ns['cap'], tag),
+                    field,
+                    field in self.OPTIONAL_FIELDS,
+                )
+                for tag, field in tag_map.items()
+            ]
+            for lang, tag_map in self.TAG_MAP.items()
+        }
+
+    def _iterparse(self, f):
+        with suppress(ImportError):
+            import lxml.etree
+            # Let libxml2 skip end events of elements we don't look at
+            return lxml.etree.iterparse(
+                f,
+                tag=[self.INFO_TAG, self.ALERT_TAG],
+                resolve_entities=False,
+                remove_blank_text=True,
+            )
+        return ET.iterparse(f)
+
     def _parse_info(self, event, element):
-        lang = element.find('cap:language', self.ns).text.split('-')[0]
-        tag_map = self.TAG_MAP.get(lang, {})
-        for tag, field in tag_map.items():
-            e = element.find(f'cap:{tag}', self.ns)
+        lang = element.find(self.LANGUAGE_TAG).text.split('-')[0]
+        tag_fields = self.tag_fields.get(lang, [])
+        for tag, qualified_tag, field, optional in tag_fields:
+            e = element.find(qualified_tag)
             if e is not None:
                 event[field] = e.text
-            elif field in self.OPTIONAL_FIELDS:
+            elif optional:
                 event[field] = None
             else:
                 raise ValueError("Unable to find <%s>" % tag)
@@ -933,19 +1073,14 @@ class CAPParser(Parser):
         if 'warn_cell_ids' not in event:
             event['warn_cell_ids'] = list(self._parse_warn_cell_ids(element))
 
-    def _is_tag(self, element, tag):
-        prefix, tag = tag.split(':')
-        return element.tag == f'{{{self.ns[prefix]}}}{tag}'
-
     def _parse_event_code(self, element):
-        for ec_element in element.findall('cap:eventCode', self.ns):
-            if ec_element.find('cap:valueName', self.ns).text == 'II':
-                return int(ec_element.find('cap:value', self.ns).text)
+        value = element.find(self.EVENT_CODE_PATH, self.ns)
+        if value is not None:
+            return int(value.text)
 
     def _parse_warn_cell_ids(self, element):
-        for gc_element in element.findall('cap:area/cap:geocode', self.ns):
-            if gc_element.find('cap:valueName', self.ns).text == 'WARNCELLID':
-                yield int(gc_element.find('cap:value', self.ns).text)
+        for value in element.iterfind(self.WARN_CELL_ID_PATH, self.ns):
+            yield int(value.text)
 
     def sanitize_event(self, event):
         for field in self.TOKEN_FIELDS:
@@ -958,8 +1093,9 @@ class CAPParser(Parser):
             event[field] = datetime.datetime.fromisoformat(event[field])
 
 
-def get_parser(filename):
-    parsers = {
+_PARSERS = [
+    (re.compile(pattern), parser)
+    for pattern, parser in {
         r'DE1200_RV': RADOLANParser,
         r'MOSMIX_(S|L)_LATEST(_240)?\.kmz$': MOSMIXParser,
         r'Z__C_EDZW_\d+_.*\.json\.bz2$': SYNOPParser,
@@ -975,7 +1111,13 @@ def get_parser(filename):
         'stundenwerte_VV_': VisibilityObservationsParser,
         '10minutenwerte_extrema_wind_': WindGustsObservationsParser,
         '10minutenwerte_SOLAR_': SolarRadiationObservationsParser,
-    }
-    for pattern, parser in parsers.items():
-        if re.match(pattern, filename):
+    }.items()
+]
+
+
+# Bounded since file names usually contain timestamps
+@functools.lru_cache(maxsize=1024)
+def get_parser(filename):
+    for pattern, parser in _PARSERS:
+        if pattern.match(filename):
             return parser
@@ -13,6 +13,7 @@ class StationIDConverter:
         'https://www.dwd.de/DE/leistungen/klimadatendeutschland/statliste/'
         'statlex_html.html?view=nasPublication')
     STATION_TYPES = ['SY', 'MN']
+    CELL_PATTERN = re.compile(r'<td[^>]*?>(.*?)</td>')
 
     def __init__(self):
         self.dwd_to_wmo = {}
@@ -21,7 +22,7 @@ class StationIDConverter:
     def load(self, path=None):
         logger.info("Updating station ID mappings")
         if path:
-            with open(path) as f:
+            with open(path, encoding='utf-8') as f:
                 station_list = f.read()
         else:
             station_list = fetch(self.STATION_LIST_URL).decode()
@@ -33,7 +34,7 @@ class StationIDConverter:
         for line in html.splitlines():
             if not line.startswith('<tr>') or not line.count('<td') == 11:
                 continue
-            values = re.findall(r'<td[^>]*?>(.*?)</td>', line)
+            values = self.CELL_PATTERN.findall(line)
             if values[2] not in self.STATION_TYPES:
                 continue
             dwd_id = values[1].zfill(5)
@@ -155,20 +155,36 @@ def _find(mapping, code):
         value = v
 
 
+def _table(mapping):
+    return tuple(_find(mapping, code) for code in range(max(mapping)))
+
+
+def _lookup(table, code):
+    if code is not None and 0 <= code < len(table):
+        return table[int(code)]
+
+
+_SYNOP_CURRENT_CONDITIONS = _table(SYNOP_CURRENT_CONDITION_MAP)
+_SYNOP_PAST_CONDITIONS = _table(SYNOP_PAST_CONDITION_MAP)
+_SYNOP_FORM_OF_PRECIPITATION_CONDITIONS = _table(
+    SYNOP_FORM_OF_PRECIPITATION_CONDITION_MAP)
+_CURRENT_OBSERVATIONS_CONDITIONS = _table(CURRENT_OBSERVATIONS_CONDITION_MAP)
+
+
 def synop_current_weather_code_to_condition(code):
-    return _find(SYNOP_CURRENT_CONDITION_MAP, code)
+    return _lookup(_SYNOP_CURRENT_CONDITIONS, code)
 
 
 def synop_past_weather_code_to_condition(code):
-    return _find(SYNOP_PAST_CONDITION_MAP, code)
+    return _lookup(_SYNOP_PAST_CONDITIONS, code)
 
 
 def synop_form_of_precipitation_code_to_condition(code):
-    return _find(SYNOP_FORM_OF_PRECIPITATION_CONDITION_MAP, code)
+    return _lookup(_SYNOP_FORM_OF_PRECIPITATION_CONDITIONS, code)
 
 
 def current_observations_weather_code_to_condition(code):
-    return _find(CURRENT_OBSERVATIONS_CONDITION_MAP, code)
+    return _lookup(_CURRENT_OBSERVATIONS_CONDITIONS, code)
 
 
 CONVERTERS = {
@@ -198,6 +214,18 @@ CONVERTERS = {
 
 def convert_record(record, units):
     for field, converter in CONVERTERS[units].items():
-        if record.get(field) is not None:
-            record[field] = converter(record[field])
+        value = record.get(field)
+        if value is not None:
+            record[field] = converter(value)
     return record
+
+
+def convert_records(records, units):
+    converters = tuple(CONVERTERS[units].items())
+    for record in records:
+        get = record.get
+        for field, converter in converters:
+            value = get(field)
+            if value is not None:
+                record[field] = converter(value)
+        yield record
@@ -1,6 +1,12 @@
+import functools
+import gzip
 import json
 import logging
+import os
+import shutil
+import sys
 import urllib.request
+from contextlib import suppress
 
 
 def configure_logging():
@@ -11,10 +17,55 @@ def configure_logging():
 
 
 def dump_records(it):
+    dumps = _get_dumps()
+    stdout = sys.stdout
+    stdout.flush()
+    try:
+        write = stdout.buffer.write
+    except AttributeError:
+        # Text-only streams, e.g. io.StringIO, IDLE, or some notebooks
+        def write(data):
+            stdout.write(data.decode())
     for record in it:
-        print(json.dumps(record, default=str))
+        write(dumps(record))
+
+
+def _get_dumps():
+    with suppress(ImportError):
+        import orjson
+        # Keep the str() timestamp format of the stdlib fallback
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME
+        return functools.partial(orjson.dumps, default=str, option=option)
+    # json.dumps() builds a new encoder on every call when given `default`
+    encode = json.JSONEncoder(default=str).encode
+    return lambda record: (encode(record) + '\n').encode()
 
 
 def fetch(url):
-    with urllib.request.urlopen(url) as f:
-        return f.read()
+    # Plain text responses like the station list shrink considerably when
+    # compressed
+    request = urllib.request.Request(url, headers={'Accept-Encoding': 'gzip'})
+    with urllib.request.urlopen(request) as f:
+        data = f.read()
+        if f.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return data
+
+
+def fetch_to_file(url, path, accept_gzip=False):
+    # Most downloads are archives that are already compressed, only ask for
+    # gzip transfers where the caller knows that it pays off
+    headers = {'Accept-Encoding': 'gzip'} if accept_gzip else {}
+    request = urllib.request.Request(url, headers=headers)
+    # Stream response in chunks so we never hold the full payload in memory
+    with urllib.request.urlopen(request) as r, open(path, 'wb') as f:
+        src = r
+        if r.headers.get('Content-Encoding') == 'gzip':
+            src = gzip.GzipFile(fileobj=r)
+        try:
+            shutil.copyfileobj(src, f, 1024 * 1024)
+        except BaseException:
+            # Don't leave truncated files behind
+            f.close()
+            os.remove(path)
+            raise
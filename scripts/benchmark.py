@@ -5,7 +5,7 @@ import logging
 import resource
 import time
 
-from dwdparse import parse
+from dwdparse import parse_batches
 from dwdparse.stations import StationIDConverter
 
 
@@ -23,9 +23,9 @@ print(f"Base memory usage: {base_mem:,} MiB")
 
 start = time.time()
 count = 0
-for _ in parse(FILENAME):  # noqa
-    count += 1
-    print(json.dumps(_, default=str))
+for batch in parse_batches(FILENAME):
+    count += len(batch)
+    print('\n'.join(json.dumps(record, default=str) for record in batch))
 duration = time.time() - start
 max_mem = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
 
@@ -1,9 +1,12 @@
+import os
+
 from setuptools import setup
 
 import dwdparse
 
 
-with open('README.md') as f:
+readme_path = os.path.join(os.path.dirname(__file__), 'README.md')
+with open(readme_path, encoding='utf-8') as f:
     long_description = f.read()
 
 setup(
@@ -26,6 +29,10 @@ setup(
     ],
     python_requires='>=3.8',
     extras_require={
+        'fast': [
+            'lxml',
+            'orjson',
+        ],
         'lean': [
             'ijson',
         ],
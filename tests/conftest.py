@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,15 @@ def data_dir():
     return Path(os.path.dirname(__file__)) / 'data'
 
 
+@pytest.fixture
+def block_imports(monkeypatch):
+    """Make importing the given modules fail, to test stdlib fallbacks"""
+    def block(*modules):
+        for module in modules:
+            monkeypatch.setitem(sys.modules, module, None)
+    return block
+
+
 def pytest_configure(config):
     # Dirty mock so we don't download the station list on every test run
     from dwdparse.stations import _converter
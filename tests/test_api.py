@@ -0,0 +1,107 @@
+import io
+import os
+import shutil
+
+import pytest
+
+from dwdparse import parse, parse_batches, parse_url
+from dwdparse.api import download
+from dwdparse.parsers import SolarRadiationObservationsParser
+
+
+SOLAR_FILENAME = '10minutenwerte_SOLAR_01766_now.zip'
+SOLAR_META_FILENAME = 'Meta_Daten_zehn_min_sd_01766.zip'
+
+
+@pytest.fixture
+def fetched(data_dir, monkeypatch):
+    """Serve any non-local URL from the test data, keyed by its basename"""
+    downloads = []
+
+    def fetch_to_file(url, path):
+        downloads.append((url, path))
+        shutil.copy(data_dir / os.path.basename(url), path)
+
+    monkeypatch.setattr('dwdparse.api.fetch_to_file', fetch_to_file)
+    return downloads
+
+
+def test_parse_file_object(data_dir):
+    path = data_dir / 'MOSMIX_L_LATEST.kmz'
+    f = io.BytesIO(path.read_bytes())
+    records = list(parse(f, filename='MOSMIX_L_LATEST.kmz'))
+    assert records == list(parse(path))
+
+
+def test_parse_requires_filename_for_unnamed_file_objects(data_dir):
+    f = io.BytesIO((data_dir / 'MOSMIX_L_LATEST.kmz').read_bytes())
+    with pytest.raises(ValueError, match='filename'):
+        parse(f)
+
+
+def test_parse_batches(data_dir):
+    path = data_dir / 'MOSMIX_L_LATEST.kmz'
+    batches = list(parse_batches(path, batch_size=100))
+    assert [len(batch) for batch in batches] == [100, 100, 47]
+    assert [r for batch in batches for r in batch] == list(parse(path))
+
+
+def test_download_reads_file_urls_in_place(data_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        SolarRadiationObservationsParser,
+        'META_DATA_URL',
+        data_dir.as_uri() + '/Meta_Daten_zehn_min_sd_{dwd_station_id}.zip',
+    )
+    url = (data_dir / SOLAR_FILENAME).as_uri()
+    file_path, extra = download(url, tmp_path)
+    assert file_path == data_dir / SOLAR_FILENAME
+    assert extra == {'meta_path': data_dir / SOLAR_META_FILENAME}
+    assert not list(tmp_path.iterdir())
+
+
+def test_download_fetches_duplicate_extra_urls_once(
+        fetched, tmp_path, monkeypatch):
+    meta_url = f'https://example.com/{SOLAR_META_FILENAME}'
+    monkeypatch.setattr(
+        SolarRadiationObservationsParser,
+        'get_extra_urls',
+        lambda self, path: {'meta_path': meta_url, 'other_path': meta_url},
+    )
+    file_path, extra = download(
+        f'https://example.com/{SOLAR_FILENAME}', tmp_path)
+    assert file_path == tmp_path / SOLAR_FILENAME
+    assert extra == {
+        'meta_path': tmp_path / SOLAR_META_FILENAME,
+        'other_path': tmp_path / SOLAR_META_FILENAME,
+    }
+    assert sorted(url for url, _ in fetched) == [
+        f'https://example.com/{SOLAR_FILENAME}',
+        meta_url,
+    ]
+
+
+def test_parse_url_leaves_downloads_in_tmpdir(fetched, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        SolarRadiationObservationsParser,
+        'META_DATA_URL',
+        'https://example.com/Meta_Daten_zehn_min_sd_{dwd_station_id}.zip',
+    )
+    url = f'https://example.com/{SOLAR_FILENAME}'
+    records = list(parse_url(url, tmpdir=tmp_path))
+    assert len(records) == 12
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        SOLAR_FILENAME,
+        SOLAR_META_FILENAME,
+    ]
+
+
+def test_parse_url_removes_its_own_tmpdir(fetched, monkeypatch):
+    monkeypatch.setattr(
+        SolarRadiationObservationsParser,
+        'META_DATA_URL',
+        'https://example.com/Meta_Daten_zehn_min_sd_{dwd_station_id}.zip',
+    )
+    records = list(parse_url(f'https://example.com/{SOLAR_FILENAME}'))
+    assert len(records) == 12
+    assert len(fetched) == 2
+    assert not any(os.path.exists(path) for _, path in fetched)
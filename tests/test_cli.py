@@ -0,0 +1,147 @@
+import os
+import shutil
+import time
+
+import pytest
+
+from dwdparse import parse
+from dwdparse.cli import (
+    STATION_LIST_MAX_AGE,
+    _get_cached_station_list,
+    _parse_targets,
+    main,
+)
+
+
+@pytest.fixture
+def fetched(data_dir, monkeypatch):
+    """Serve any non-local URL from the test data, keyed by its basename"""
+    downloads = {}
+
+    def fetch_to_file(url, path):
+        downloads[url] = path
+        shutil.copy(data_dir / os.path.basename(url), path)
+
+    monkeypatch.setattr('dwdparse.api.fetch_to_file', fetch_to_file)
+    return downloads
+
+
+def test_parse_targets_keeps_target_order(fetched, data_dir, tmp_path):
+    cap_path = str(
+        data_dir
+        / 'Z_CAP_C_EDZW_LATEST_PVW_STATUS_PREMIUMDWD_COMMUNEUNION_MUL.zip'
+    )
+    targets = [
+        'https://example.com/MOSMIX_L_LATEST.kmz',
+        cap_path,
+        'https://example.com/10315-BEOB.csv',
+    ]
+    expected = [
+        *parse(data_dir / 'MOSMIX_L_LATEST.kmz'),
+        *parse(cap_path),
+        *parse(data_dir / '10315-BEOB.csv'),
+    ]
+    assert list(_parse_targets(targets, tmp_path, 2)) == expected
+    # Local targets are parsed in place, and never removed
+    assert len(fetched) == 2
+    assert os.path.exists(cap_path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_parse_targets_downloads_at_most_jobs_ahead(
+        fetched, data_dir, tmp_path):
+    jobs = 2
+    records_per_target = len(list(parse(data_dir / '10315-BEOB.csv')))
+    urls = [f'https://example.com/{i}/10315-BEOB.csv' for i in range(6)]
+    records = _parse_targets(urls, tmp_path, jobs)
+    for i, _ in enumerate(records):
+        current = i // records_per_target
+        assert len(fetched) <= current + 1 + jobs
+        # Targets are removed as soon as they have been parsed
+        assert os.path.exists(fetched[urls[current]])
+        for url in urls[:current]:
+            assert not os.path.exists(fetched[url])
+    assert i + 1 == len(urls) * records_per_target
+    assert os.listdir(tmp_path) == []
+
+
+def test_parse_targets_cleans_up_when_closed_early(fetched, tmp_path):
+    url = 'https://example.com/10315-BEOB.csv'
+    records = _parse_targets([url], tmp_path, 1)
+    next(records)
+    assert os.path.exists(fetched[url])
+    records.close()
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    return tmp_path / 'dwdparse'
+
+
+@pytest.fixture
+def station_list_source(data_dir, monkeypatch):
+    """Serve the station list download from the given test data file"""
+    source = {'filename': 'station_list.html', 'fetched': 0}
+
+    def fetch_to_file(url, path, **kwargs):
+        source['fetched'] += 1
+        shutil.copy(data_dir / source['filename'], path)
+
+    monkeypatch.setattr('dwdparse.cli.fetch_to_file', fetch_to_file)
+    return source
+
+
+def _write_cached_list(cache_dir, age):
+    cache_dir.mkdir()
+    path = cache_dir / 'stations.html'
+    path.write_text('cached')
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cached_station_list_is_downloaded_to_xdg_cache_home(
+        cache_dir, station_list_source, data_dir):
+    path = _get_cached_station_list()
+    assert path == str(cache_dir / 'stations.html')
+    assert station_list_source['fetched'] == 1
+    assert (cache_dir / 'stations.html').read_bytes() == (
+        (data_dir / 'station_list.html').read_bytes())
+
+
+def test_cached_station_list_is_reused_while_fresh(
+        cache_dir, station_list_source):
+    path = _write_cached_list(cache_dir, STATION_LIST_MAX_AGE / 2)
+    assert _get_cached_station_list() == str(path)
+    assert station_list_source['fetched'] == 0
+    assert path.read_text() == 'cached'
+
+
+def test_cached_station_list_is_refreshed_when_stale(
+        cache_dir, station_list_source, data_dir):
+    path = _write_cached_list(cache_dir, STATION_LIST_MAX_AGE + 60)
+    assert _get_cached_station_list() == str(path)
+    assert station_list_source['fetched'] == 1
+    assert path.read_bytes() == (data_dir / 'station_list.html').read_bytes()
+
+
+def test_cached_station_list_rejects_invalid_downloads(
+        cache_dir, station_list_source):
+    path = _write_cached_list(cache_dir, STATION_LIST_MAX_AGE + 60)
+    station_list_source['filename'] = 'station_list_empty.html'
+    with pytest.raises(AssertionError):
+        _get_cached_station_list()
+    # The stale list is kept, and the next run will simply try again
+    assert os.listdir(cache_dir) == ['stations.html']
+    assert path.read_text() == 'cached'
+
+
+@pytest.mark.parametrize('jobs', ['0', '-1'])
+def test_jobs_must_be_positive(jobs, monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['dwdparse', '--jobs', jobs, 'x.kmz'])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
+    assert '--jobs must be at least 1' in capsys.readouterr().err
@@ -1,4 +1,8 @@
 import datetime
+import io
+import itertools
+
+import pytest
 
 from dwdparse.parsers import (
     CAPParser,
@@ -232,6 +236,18 @@ def test_observations_parser_handles_location_changes(data_dir):
         {'lat': 50.0, 'lon': 13.0, 'height': 345.0}, records[-1])
 
 
+def test_observations_parser_supports_interleaved_parses(data_dir):
+    paths = [
+        data_dir / 'observations_recent_FF_akt.zip',
+        data_dir / 'observations_recent_FF_location_change_akt.zip',
+    ]
+    expected = [list(WindObservationsParser().parse(path)) for path in paths]
+    p = WindObservationsParser()
+    interleaved = list(itertools.zip_longest(*(p.parse(x) for x in paths)))
+    assert [a for a, _ in interleaved if a] == expected[0]
+    assert [b for _, b in interleaved if b] == expected[1]
+
+
 def test_observations_parser_skip_timestamp(data_dir):
     p = WindObservationsParser()
     records = list(p.parse(data_dir / 'observations_recent_FF_akt.zip'))
@@ -421,11 +437,10 @@ def test_radolan_parser(data_dir):
         2023, 5, 8, 14, 20, tzinfo=utc,
     )
     data = records[0]['precipitation_5']
-    data_flat = [x for row in data for x in row]
     assert len(data) == 1200
     assert all(len(row) == 1100 for row in data)
-    assert sum(x is None for x in data_flat) == 623059
-    assert round(sum(x or 0 for x in data_flat), 2) == 5640.30
+    assert sum(row.count(None) for row in data) == 623059
+    assert round(sum(sum(filter(None, row)) for row in data), 2) == 5640.30
     clipped = [
         row[334:339]
         for row in data[1117:1122]
@@ -480,6 +495,48 @@ def test_cap_parser(data_dir):
     }
 
 
+def test_parsers_accept_file_objects(data_dir):
+    targets = {
+        'MOSMIX_L_LATEST.kmz': MOSMIXParser,
+        'synop.json.bz2': SYNOPParser,
+        '10315-BEOB.csv': CurrentObservationsParser,
+        'observations_recent_FF_akt.zip': WindObservationsParser,
+        'DE1200_RV2305081330.tar.bz2': RADOLANParser,
+        'Z_CAP_C_EDZW_LATEST_PVW_STATUS_PREMIUMDWD_COMMUNEUNION_MUL.zip': (
+            CAPParser),
+    }
+    for filename, cls in targets.items():
+        path = data_dir / filename
+        f = io.BytesIO(path.read_bytes())
+        assert list(cls().parse(f)) == list(cls().parse(path))
+        assert not f.closed
+
+
+@pytest.mark.parametrize(
+    'blocked',
+    [
+        ['ijson'],
+        ['ijson', 'lxml', 'lxml.etree', 'orjson'],
+    ],
+    ids=['orjson', 'stdlib'],
+)
+def test_parsers_match_across_optional_backends(
+        data_dir, block_imports, blocked):
+    targets = {
+        'MOSMIX_L_LATEST.kmz': MOSMIXParser,
+        'synop.json.bz2': SYNOPParser,
+        'Z_CAP_C_EDZW_LATEST_PVW_STATUS_PREMIUMDWD_COMMUNEUNION_MUL.zip': (
+            CAPParser),
+    }
+    expected = {
+        filename: list(cls().parse(data_dir / filename))
+        for filename, cls in targets.items()
+    }
+    block_imports(*blocked)
+    for filename, cls in targets.items():
+        assert list(cls().parse(data_dir / filename)) == expected[filename]
+
+
 def test_get_parser():
     synop_with_timestamp = (
         'Z__C_EDZW_20200617114802_bda01,synop_bufr_GER_999999_999999__MW_617'
@@ -1,5 +1,6 @@
 from dwdparse.units import (
     convert_record,
+    convert_records,
     synop_current_weather_code_to_condition,
 )
 
@@ -64,3 +65,14 @@ def test_convert_record():
     }
     convert_record(record, 'dwd')
     assert record == expected
+
+
+def test_convert_records():
+    records = [
+        {'temperature': 296.65, 'wind_speed': None},
+        {'temperature': None, 'wind_speed': 5, 'icon': 'cloudy'},
+    ]
+    assert list(convert_records(records, 'dwd')) == [
+        {'temperature': 23.5, 'wind_speed': None},
+        {'temperature': None, 'wind_speed': 18, 'icon': 'cloudy'},
+    ]
@@ -0,0 +1,100 @@
+import contextlib
+import datetime
+import gzip
+import http.server
+import io
+import json
+import threading
+
+import pytest
+
+from dwdparse.utils import dump_records, fetch, fetch_to_file
+
+
+RECORDS = [
+    {'a': 1, 'b': None},
+    {'timestamp': datetime.datetime(
+        2023, 5, 8, 13, 30, tzinfo=datetime.timezone.utc)},
+]
+DUMPED_RECORDS = [
+    {'a': 1, 'b': None},
+    {'timestamp': '2023-05-08 13:30:00+00:00'},
+]
+
+
+@pytest.mark.parametrize('blocked', [[], ['orjson']], ids=['default', 'json'])
+def test_dump_records(capsys, block_imports, blocked):
+    block_imports(*blocked)
+    dump_records(RECORDS)
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == DUMPED_RECORDS
+
+
+def test_dump_records_to_text_stream():
+    f = io.StringIO()
+    with contextlib.redirect_stdout(f):
+        dump_records(RECORDS)
+    lines = f.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == DUMPED_RECORDS
+
+
+def test_fetch_to_file(data_dir, tmp_path):
+    source = data_dir / 'station_list.html'
+    path = tmp_path / 'station_list.html'
+    fetch_to_file(source.as_uri(), path)
+    assert path.read_bytes() == source.read_bytes()
+
+
+def test_fetch_to_file_reports_unwritable_path(data_dir, tmp_path):
+    path = tmp_path / 'missing' / 'station_list.html'
+    with pytest.raises(FileNotFoundError) as exc_info:
+        fetch_to_file((data_dir / 'station_list.html').as_uri(), path)
+    assert exc_info.value.filename == str(path)
+    assert exc_info.value.__context__ is None
+
+
+@pytest.fixture(scope='module')
+def gzip_server(data_dir):
+    """Serve test data, gzip-compressed whenever the client accepts it"""
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            # Record before responding, the client may check right after
+            self.server.encodings.append(self.headers.get('Accept-Encoding'))
+            body = (data_dir / self.path.lstrip('/')).read_bytes()
+            self.send_response(200)
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(('localhost', 0), Handler)
+    server.encodings = []
+    threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': .01},
+        daemon=True,
+    ).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('accept_gzip', [False, True])
+def test_fetch_to_file_decodes_gzip(
+        data_dir, tmp_path, gzip_server, accept_gzip):
+    url = f'http://localhost:{gzip_server.server_port}/station_list.html'
+    path = tmp_path / 'station_list.html'
+    fetch_to_file(url, path, accept_gzip=accept_gzip)
+    assert path.read_bytes() == (data_dir / 'station_list.html').read_bytes()
+    assert ('gzip' in gzip_server.encodings[-1]) == accept_gzip
+
+
+def test_fetch_decodes_gzip(data_dir, gzip_server):
+    url = f'http://localhost:{gzip_server.server_port}/station_list.html'
+    assert fetch(url) == (data_dir / 'station_list.html').read_bytes()
+    assert gzip_server.encodings[-1] == 'gzip'